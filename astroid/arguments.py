@@ -14,6 +14,9 @@ from astroid import nodes
 from astroid import util
 
 
+# Function types whose first positional parameter is bound implicitly.
+_METHOD_TYPES = frozenset(('method', 'classmethod'))
+
 
 class CallSite(object):
     """Class for understanding arguments passed into a call site
@@ -40,6 +43,7 @@ class CallSite(object):
             key: value for key, value in self._unpacked_kwargs.items()
             if value is not util.Uninferable
         }
+        self._bound_arguments = None
 
     @classmethod
     def from_call(cls, call_node):
@@ -48,6 +52,18 @@ class CallSite(object):
                                              call_node.keywords)
         return cls(callcontext)
 
+    @classmethod
+    def from_context(cls, callcontext):
+        """Get the CallSite object of the given call context.
+
+        It is built on first use and then shared by all the arguments
+        inferred through the same call context.
+        """
+        call_site = callcontext.callsite
+        if call_site is None:
+            call_site = callcontext.callsite = cls(callcontext)
+        return call_site
+
     def has_invalid_arguments(self):
         """Check if in the current CallSite were passed *invalid* arguments
 
@@ -110,26 +126,61 @@ class CallSite(object):
     @staticmethod
     def _unpack_args(args):
         values = []
+        append = values.append
+        starred = nodes.Starred
         context = contextmod.InferenceContext()
         for arg in args:
-            if isinstance(arg, nodes.Starred):
-                try:
-                    inferred = next(arg.value.infer(context=context))
-                except exceptions.InferenceError:
-                    values.append(util.Uninferable)
-                    continue
+            # Starred has no subclasses, so skip the isinstance() MRO walk
+            # for the common case of plain positional arguments.
+            if arg.__class__ is not starred:
+                append(arg)
+                continue
+            try:
+                inferred = next(arg.value.infer(context=context))
+            except exceptions.InferenceError:
+                append(util.Uninferable)
+                continue
 
-                if inferred is util.Uninferable:
-                    values.append(util.Uninferable)
-                    continue
-                if not hasattr(inferred, 'elts'):
-                    values.append(util.Uninferable)
-                    continue
-                values.extend(inferred.elts)
-            else:
-                values.append(arg)
+            if inferred is util.Uninferable:
+                append(util.Uninferable)
+                continue
+            if not hasattr(inferred, 'elts'):
+                append(util.Uninferable)
+                continue
+            values.extend(inferred.elts)
         return values
 
+    def _bind_arguments(self, funcnode):
+        """Get the arguments which go into *funcnode*'s variable arguments.
+
+        They don't depend on the argument being inferred, so they are
+        computed once and reused as long as the same function is asked for.
+
+        :returns: The extra positional arguments and the keyword arguments
+            which don't match a named parameter.
+        :rtype: tuple(list(NodeNG), dict(str, NodeNG))
+        """
+        bound = self._bound_arguments
+        if bound is not None and bound[0] is funcnode:
+            return bound[1], bound[2]
+
+        vararg = self.positional_arguments[len(funcnode.args.args):]
+        kwonlyargs = set(arg.name for arg in funcnode.args.kwonlyargs)
+        kwargs = {
+            key: value for key, value in self.keyword_arguments.items()
+            if key not in kwonlyargs
+        }
+        # If there are too few positionals compared to
+        # what the function expects to receive, the missing
+        # positional arguments may have been passed as keyword
+        # arguments, in which case they don't go into **kwargs.
+        if len(self.positional_arguments) < len(funcnode.args.args):
+            for func_arg in funcnode.args.args:
+                kwargs.pop(func_arg.name, None)
+
+        self._bound_arguments = (funcnode, vararg, kwargs)
+        return vararg, kwargs
+
     def infer_argument(self, funcnode, name, context):
         """infer a function argument value according to the call context
 
@@ -159,28 +210,13 @@ class CallSite(object):
                                                 call_site=self, func=funcnode,
                                                 arg=name, context=context)
 
-        positional = self.positional_arguments[:len(funcnode.args.args)]
-        vararg = self.positional_arguments[len(funcnode.args.args):]
+        vararg, kwargs = self._bind_arguments(funcnode)
         argindex = funcnode.args.find_argname(name)[0]
-        kwonlyargs = set(arg.name for arg in funcnode.args.kwonlyargs)
-        kwargs = {
-            key: value for key, value in self.keyword_arguments.items()
-            if key not in kwonlyargs
-        }
-        # If there are too few positionals compared to
-        # what the function expects to receive, check to see
-        # if the missing positional arguments were passed
-        # as keyword arguments and if so, place them into the
-        # positional args list.
-        if len(positional) < len(funcnode.args.args):
-            for func_arg in funcnode.args.args:
-                if func_arg.name in kwargs:
-                    arg = kwargs.pop(func_arg.name)
-                    positional.append(arg)
 
         if argindex is not None:
+            functype = funcnode.type
             # 2. first argument of instance/class method
-            if argindex == 0 and funcnode.type in ('method', 'classmethod'):
+            if argindex == 0 and functype in _METHOD_TYPES:
                 if context.boundnode is not None:
                     boundnode = context.boundnode
                 else:
@@ -196,16 +232,16 @@ class CallSite(object):
                     if method_scope is boundnode.metaclass():
                         return iter((boundnode, ))
 
-                if funcnode.type == 'method':
+                if functype == 'method':
                     if not isinstance(boundnode, bases.Instance):
                         boundnode = bases.Instance(boundnode)
                     return iter((boundnode,))
-                if funcnode.type == 'classmethod':
+                if functype == 'classmethod':
                     return iter((boundnode,))
             # if we have a method, extract one position
             # from the index, so we'll take in account
             # the extra parameter represented by `self` or `cls`
-            if funcnode.type in ('method', 'classmethod'):
+            if functype in _METHOD_TYPES:
                 argindex -= 1
             # 2. search arg index
             try:
@@ -244,7 +280,7 @@ class CallSite(object):
             args = nodes.Tuple(lineno=funcnode.args.lineno,
                                col_offset=funcnode.args.col_offset,
                                parent=funcnode.args)
-            args.postinit(vararg)
+            args.postinit(list(vararg))
             return iter((args, ))
 
         # Check if it's a default parameter.
@@ -21,6 +21,7 @@ from astroid import util
 
 objectmodel = util.lazy_import('interpreter.objectmodel')
 BUILTINS = six.moves.builtins.__name__
+_GENERATOR_PYTYPE = '%s.generator' % BUILTINS
 manager = util.lazy_import('manager')
 MANAGER = manager.AstroidManager()
 
@@ -85,8 +86,9 @@ def _infer_stmts(stmts, context, frame=None):
         name = None
         context = contextmod.InferenceContext()
 
+    uninferable = util.Uninferable
     for stmt in stmts:
-        if stmt is util.Uninferable:
+        if stmt is uninferable:
             yield stmt
             inferred = True
             continue
@@ -98,7 +100,7 @@ def _infer_stmts(stmts, context, frame=None):
         except exceptions.NameInferenceError:
             continue
         except exceptions.InferenceError:
-            yield util.Uninferable
+            yield uninferable
             inferred = True
     if not inferred:
         raise exceptions.InferenceError(
@@ -438,7 +440,7 @@ class Generator(BaseInstance):
         return False
 
     def pytype(self):
-        return '%s.generator' % BUILTINS
+        return _GENERATOR_PYTYPE
 
     def display_type(self):
         return 'Generator'
@@ -7,7 +7,6 @@
 """Various context related utilities, including inference and call contexts."""
 
 import contextlib
-import copy
 import pprint
 
 
@@ -58,7 +57,9 @@ class InferenceContext(object):
         starts with the same context but diverge as each side is inferred
         so the InferenceContext will need be cloned"""
         # XXX copy lookupname/callcontext ?
-        clone = InferenceContext(copy.copy(self.path), inferred=self.inferred)
+        # set.copy() rather than copy.copy(), this is called for nearly
+        # every inferred name and call and the generic copy dispatch shows.
+        clone = InferenceContext(self.path.copy(), inferred=self.inferred)
         clone.callcontext = self.callcontext
         clone.boundnode = self.boundnode
         return clone
@@ -90,7 +91,7 @@ class InferenceContext(object):
 class CallContext(object):
     """Holds information for a call site."""
 
-    __slots__ = ('args', 'keywords')
+    __slots__ = ('args', 'keywords', 'callsite')
 
     def __init__(self, args, keywords=None):
         self.args = args
@@ -99,6 +100,9 @@ class CallContext(object):
         else:
             keywords = []
         self.keywords = keywords
+        self.callsite = None
+        """The arguments.CallSite built from this context, once needed
+        :type: arguments.CallSite or None"""
 
 
 def copy_context(context):
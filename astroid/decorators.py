@@ -79,8 +79,13 @@ def path_wrapper(func):
         """wrapper function handling context"""
         if context is None:
             context = contextmod.InferenceContext()
-        if context.push(node):
+        # Same as context.push(node), inlined since this runs for
+        # every wrapped inference step.
+        path = context.path
+        key = (node, context.lookupname)
+        if key in path:
             return
+        path.add(key)
 
         yielded = set()
         generator = _func(node, context, **kwargs)
@@ -163,13 +163,16 @@ def infer_call(self, context=None):
     callcontext.callcontext = contextmod.CallContext(args=self.args,
                                                      keywords=self.keywords)
     callcontext.boundnode = None
+    uninferable = util.Uninferable
     for callee in self.func.infer(context):
-        if callee is util.Uninferable:
+        if callee is uninferable:
             yield callee
             continue
         try:
-            if hasattr(callee, 'infer_call_result'):
-                for inferred in callee.infer_call_result(self, callcontext):
+            # Look the method up once, instead of hasattr() then getattr().
+            infer_call_result = getattr(callee, 'infer_call_result', None)
+            if infer_call_result is not None:
+                for inferred in infer_call_result(self, callcontext):
                     yield inferred
         except exceptions.InferenceError:
             ## XXX log error ?
@@ -303,7 +306,16 @@ def infer_subscript(self, context=None):
         yield util.Uninferable
         return
 
-    index = next(self.slice.infer(context))
+    index = self.slice
+    if (index.__class__ is nodes.Index
+            and index.value.__class__ is nodes.Const
+            and index._explicit_inference is None
+            and index.value._explicit_inference is None):
+        # Literal index, such as x[0] or x['key'], which would infer
+        # back to the very same Const through the Index node.
+        index = index.value
+    else:
+        index = next(self.slice.infer(context))
     if index is util.Uninferable:
         yield util.Uninferable
         return
@@ -419,15 +431,16 @@ def _filter_operation_errors(self, infer_callable, context, error):
 
 def _infer_unaryop(self, context=None):
     """Infer what an UnaryOp should return when evaluated."""
+    op = self.op
     for operand in self.operand.infer(context):
         try:
-            yield operand.infer_unary_op(self.op)
+            yield operand.infer_unary_op(op)
         except TypeError as exc:
             # The operand doesn't support this operation.
-            yield util.BadUnaryOperationMessage(operand, self.op, exc)
+            yield util.BadUnaryOperationMessage(operand, op, exc)
         except AttributeError as exc:
-            meth = protocols.UNARY_OP_METHOD[self.op]
-            if meth is None:
+            meth_name = protocols.UNARY_OP_METHOD[op]
+            if meth_name is None:
                 # `not node`. Determine node's boolean
                 # value and negate its result, unless it is
                 # Uninferable, which will be returned as is.
@@ -440,14 +453,14 @@ def _infer_unaryop(self, context=None):
                 if not isinstance(operand, (bases.Instance, nodes.ClassDef)):
                     # The operation was used on something which
                     # doesn't support it.
-                    yield util.BadUnaryOperationMessage(operand, self.op, exc)
+                    yield util.BadUnaryOperationMessage(operand, op, exc)
                     continue
 
                 try:
                     try:
-                        methods = dunder_lookup.lookup(operand, meth)
+                        methods = dunder_lookup.lookup(operand, meth_name)
                     except exceptions.AttributeInferenceError:
-                        yield util.BadUnaryOperationMessage(operand, self.op, exc)
+                        yield util.BadUnaryOperationMessage(operand, op, exc)
                         continue
 
                     meth = methods[0]
@@ -466,7 +479,7 @@ def _infer_unaryop(self, context=None):
                         yield result
                 except exceptions.AttributeInferenceError as exc:
                     # The unary operation special method was not found.
-                    yield util.BadUnaryOperationMessage(operand, self.op, exc)
+                    yield util.BadUnaryOperationMessage(operand, op, exc)
                 except exceptions.InferenceError:
                     yield util.Uninferable
 
@@ -545,7 +558,9 @@ def _get_binop_contexts(context, left, right):
 
 def _same_type(type1, type2):
     """Check if type1 is the same as type2."""
-    return type1.qname() == type2.qname()
+    # The identity check spares building both qualified names in the
+    # common case of operands proxying the very same class.
+    return type1 is type2 or type1.qname() == type2.qname()
 
 
 def _get_binop_flow(left, left_type, binary_opnode, right, right_type,
@@ -626,6 +641,7 @@ def _infer_binary_operation(left, right, binary_opnode, context, flow_factory):
     right_type = helpers.object_type(right)
     methods = flow_factory(left, left_type, binary_opnode, right, right_type,
                            context, reverse_context)
+    uninferable = util.Uninferable
     for method in methods:
         try:
             results = list(method())
@@ -634,23 +650,23 @@ def _infer_binary_operation(left, right, binary_opnode, context, flow_factory):
         except exceptions.AttributeInferenceError:
             continue
         except exceptions.InferenceError:
-            yield util.Uninferable
+            yield uninferable
             return
         else:
-            if any(result is util.Uninferable for result in results):
-                yield util.Uninferable
+            if any(result is uninferable for result in results):
+                yield uninferable
                 return
 
             # TODO(cpopa): since the inference engine might return
             # more values than are actually possible, we decide
             # to return util.Uninferable if we have union types.
-            if all(map(_is_not_implemented, results)):
-                continue
             not_implemented = sum(1 for result in results
                                   if _is_not_implemented(result))
-            if not_implemented and not_implemented != len(results):
+            if not_implemented == len(results):
+                continue
+            if not_implemented:
                 # Can't decide yet what this is, not yet though.
-                yield util.Uninferable
+                yield uninferable
                 return
 
             for result in results:
@@ -674,16 +690,17 @@ def _infer_binop(self, context):
     lhs_context = context.clone()
     rhs_context = context.clone()
 
+    uninferable = util.Uninferable
     for lhs in left.infer(context=lhs_context):
-        if lhs is util.Uninferable:
+        if lhs is uninferable:
             # Don't know how to process this.
-            yield util.Uninferable
+            yield uninferable
             return
 
         for rhs in right.infer(context=rhs_context):
-            if rhs is util.Uninferable:
+            if rhs is uninferable:
                 # Don't know how to process this.
-                yield util.Uninferable
+                yield uninferable
                 return
 
             try:
@@ -691,7 +708,7 @@ def _infer_binop(self, context):
                                                       context, _get_binop_flow):
                     yield result
             except exceptions._NonDeducibleTypeHierarchy:
-                yield util.Uninferable
+                yield uninferable
 
 
 @decorators.yes_if_nothing_inferred
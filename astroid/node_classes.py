@@ -32,6 +32,11 @@ from astroid import util
 
 
 BUILTINS = six.moves.builtins.__name__
+_DICT_PYTYPE = '%s.dict' % BUILTINS
+_LIST_PYTYPE = '%s.list' % BUILTINS
+_SET_PYTYPE = '%s.set' % BUILTINS
+_SLICE_PYTYPE = '%s.slice' % BUILTINS
+_TUPLE_PYTYPE = '%s.tuple' % BUILTINS
 MANAGER = manager.AstroidManager()
 
 
@@ -1489,9 +1494,25 @@ class Arguments(mixins.AssignTypeMixin, NodeNG):
         :rtype: tuple(str or None, AssignName or None)
         """
         if self.args: # self.args may be None in some cases (builtin function)
-            return _find_arg(argname, self.args, rec)
+            if rec:
+                return _find_arg(argname, self.args, rec)
+            return self._argname_indices.get(argname, (None, None))
         return None, None
 
+    @decorators.cachedproperty
+    def _argname_indices(self):
+        """A mapping of the positional argument names to their index and node.
+
+        Arguments in unpacked tuples are not included.
+
+        :type: dict(str, tuple(int, AssignName))
+        """
+        indices = {}
+        for index, arg in enumerate(self.args or ()):
+            if not isinstance(arg, Tuple):
+                indices.setdefault(arg.name, (index, arg))
+        return indices
+
     def get_children(self):
         """Get the child nodes below this node.
 
@@ -2439,6 +2460,7 @@ class Dict(NodeNG, bases.Instance):
     <Dict.dict l.1 at 0x7f23b2e35cc0>
     """
     _astroid_fields = ('items',)
+    _const_items_cache = None
 
     def __init__(self, lineno=None, col_offset=None, parent=None):
         """
@@ -2492,7 +2514,7 @@ class Dict(NodeNG, bases.Instance):
         :returns: The name of the type.
         :rtype: str
         """
-        return '%s.dict' % BUILTINS
+        return _DICT_PYTYPE
 
     def get_children(self):
         """Get the key and value nodes below this node.
@@ -2523,7 +2545,37 @@ class Dict(NodeNG, bases.Instance):
         :returns: The keys of this node.
         :rtype: iterable(NodeNG)
         """
-        return self.items[::2]
+        return [key for (key, _) in self.items]
+
+    def _const_items(self):
+        """Get a mapping of the key values to the value nodes of this node.
+
+        The mapping is built once for the current :attr:`items`, and only
+        if every key is a :class:`Const` with a hashable value and without
+        an inference tip. The value of the first matching key is kept, as
+        done by :meth:`getitem`. Only reassigning :attr:`items` rebuilds
+        the mapping, changing the list in place is not noticed.
+
+        :returns: The mapping, or None if some keys aren't constants.
+        :rtype: dict or None
+        """
+        items = self.items
+        cache = self._const_items_cache
+        if cache is not None and cache[0] is items:
+            return cache[1]
+
+        const_items = {}
+        for key, value in items:
+            if key.__class__ is not Const or key._explicit_inference is not None:
+                const_items = None
+                break
+            try:
+                const_items.setdefault(key.value, value)
+            except TypeError:
+                const_items = None
+                break
+        self._const_items_cache = (items, const_items)
+        return const_items
 
     def getitem(self, index, context=None):
         """Get an item from this node.
@@ -2536,6 +2588,17 @@ class Dict(NodeNG, bases.Instance):
         :raises AstroidIndexError: If the given index does not exist in the
             dictionary.
         """
+        const_items = self._const_items()
+        if const_items is not None and isinstance(index, Const):
+            try:
+                if index.value in const_items:
+                    return const_items[index.value]
+            except TypeError:
+                # Unhashable index, fallback to comparing it with every key.
+                pass
+            else:
+                raise exceptions.AstroidIndexError(index)
+
         for key, value in self.items:
             # TODO(cpopa): no support for overriding yet, {1:2, **{1: 3}}.
             if isinstance(key, DictUnpack):
@@ -3276,7 +3339,7 @@ class List(_BaseContainer):
         :returns: The name of the type.
         :rtype: str
         """
-        return '%s.list' % BUILTINS
+        return _LIST_PYTYPE
 
     def getitem(self, index, context=None):
         """Get an item from this node.
@@ -3504,7 +3567,7 @@ class Set(_BaseContainer):
         :returns: The name of the type.
         :rtype: str
         """
-        return '%s.set' % BUILTINS
+        return _SET_PYTYPE
 
 
 class Slice(NodeNG):
@@ -3568,7 +3631,7 @@ class Slice(NodeNG):
         :returns: The name of the type.
         :rtype: str
         """
-        return '%s.slice' % BUILTINS
+        return _SLICE_PYTYPE
 
     def igetattr(self, attrname, context=None):
         """Infer the possible values of the given attribute on the slice.
@@ -3864,7 +3927,7 @@ class Tuple(_BaseContainer):
         :returns: The name of the type.
         :rtype: str
         """
-        return '%s.tuple' % BUILTINS
+        return _TUPLE_PYTYPE
 
     def getitem(self, index, context=None):
         """Get an item from this node.
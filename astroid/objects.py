@@ -26,6 +26,8 @@ from astroid import util
 
 
 BUILTINS = six.moves.builtins.__name__
+_FROZENSET_PYTYPE = '%s.frozenset' % BUILTINS
+_SUPER_PYTYPE = '%s.super' % BUILTINS
 objectmodel = util.lazy_import('interpreter.objectmodel')
 
 
@@ -33,7 +35,7 @@ class FrozenSet(node_classes._BaseContainer):
     """class representing a FrozenSet composite node"""
 
     def pytype(self):
-        return '%s.frozenset' % BUILTINS
+        return _FROZENSET_PYTYPE
 
     def _infer(self, context=None):
         yield self
@@ -108,7 +110,7 @@ class Super(node_classes.NodeNG):
         return builtins.getattr('super')[0]
 
     def pytype(self):
-        return '%s.super' % BUILTINS
+        return _SUPER_PYTYPE
 
     def display_type(self):
         return 'Super of'
@@ -87,18 +87,20 @@ nodes.Dict.infer_unary_op = lambda self, op: _infer_unary_op(dict(self.items), o
 
 # Binary operations
 
-BIN_OP_IMPL = {'+':  lambda a, b: a + b,
-               '-':  lambda a, b: a - b,
-               '/':  lambda a, b: a / b,
-               '//': lambda a, b: a // b,
-               '*':  lambda a, b: a * b,
-               '**': lambda a, b: a ** b,
-               '%':  lambda a, b: a % b,
-               '&':  lambda a, b: a & b,
-               '|':  lambda a, b: a | b,
-               '^':  lambda a, b: a ^ b,
-               '<<': lambda a, b: a << b,
-               '>>': lambda a, b: a >> b,
+# The operator module functions are implemented in C, which spares a
+# Python frame per folded constant compared to lambdas.
+BIN_OP_IMPL = {'+':  operator_mod.add,
+               '-':  operator_mod.sub,
+               '/':  operator_mod.div if six.PY2 else operator_mod.truediv,
+               '//': operator_mod.floordiv,
+               '*':  operator_mod.mul,
+               '**': operator_mod.pow,
+               '%':  operator_mod.mod,
+               '&':  operator_mod.and_,
+               '|':  operator_mod.or_,
+               '^':  operator_mod.xor,
+               '<<': operator_mod.lshift,
+               '>>': operator_mod.rshift,
               }
 if sys.version_info >= (3, 5):
     # MatMult is available since Python 3.5+.
@@ -110,24 +112,20 @@ for _KEY, _IMPL in list(BIN_OP_IMPL.items()):
 
 @decorators.yes_if_nothing_inferred
 def const_infer_binary_op(self, opnode, operator, other, context, _):
-    not_implemented = nodes.Const(NotImplemented)
     if isinstance(other, nodes.Const):
+        impl = BIN_OP_IMPL[operator]
         try:
-            impl = BIN_OP_IMPL[operator]
-            try:
-                yield nodes.const_factory(impl(self.value, other.value))
-            except TypeError:
-                # ArithmeticError is not enough: float >> float is a TypeError
-                yield not_implemented
-            except Exception: # pylint: disable=broad-except
-                yield util.Uninferable
+            yield nodes.const_factory(impl(self.value, other.value))
         except TypeError:
-            yield not_implemented
+            # ArithmeticError is not enough: float >> float is a TypeError
+            yield nodes.Const(NotImplemented)
+        except Exception: # pylint: disable=broad-except
+            yield util.Uninferable
     elif isinstance(self.value, six.string_types) and operator == '%':
         # TODO(cpopa): implement string interpolation later on.
         yield util.Uninferable
     else:
-        yield not_implemented
+        yield nodes.Const(NotImplemented)
 
 nodes.Const.infer_binary_op = const_infer_binary_op
 
@@ -312,7 +310,7 @@ def _arguments_infer_argname(self, name, context):
             return
 
     if context and context.callcontext:
-        call_site = arguments.CallSite(context.callcontext)
+        call_site = arguments.CallSite.from_context(context.callcontext)
         for value in call_site.infer_argument(self.parent, name, context):
             yield value
         return
@@ -345,7 +343,7 @@ def arguments_assigned_stmts(self, node=None, context=None, asspath=None):
         callcontext = context.callcontext
         context = contextmod.copy_context(context)
         context.callcontext = None
-        args = arguments.CallSite(callcontext)
+        args = arguments.CallSite.from_context(callcontext)
         return args.infer_argument(self.parent, node.name, context)
     return _arguments_infer_argname(self, node.name, context)
 
@@ -378,33 +376,48 @@ nodes.AugAssign.assigned_stmts = assign_assigned_stmts
 
 
 def _resolve_asspart(parts, asspath, context):
-    """recursive function to resolve multiple assignments"""
-    asspath = asspath[:]
-    index = asspath.pop(0)
-    for part in parts:
-        if hasattr(part, 'getitem'):
-            index_node = nodes.Const(index)
+    """resolve multiple assignments, following the assignment path
+
+    The path is walked with an explicit stack of iterators, one per level
+    of nesting, instead of recursing into a new generator for each level.
+    """
+    last = len(asspath) - 1
+    stack = [iter(parts)]
+    while stack:
+        depth = len(stack) - 1
+        try:
+            part = next(stack[-1])
+            if not hasattr(part, 'getitem'):
+                continue
+            index_node = nodes.Const(asspath[depth])
             try:
                 assigned = part.getitem(index_node, context)
             # XXX raise a specific exception to avoid potential hiding of
             # unexpected exception ?
             except (exceptions.AstroidTypeError, exceptions.AstroidIndexError):
-                return
-            if not asspath:
+                stack.pop()
+                continue
+            if depth == last:
                 # we achieved to resolved the assignment path, don't infer the
                 # last part
                 yield assigned
             elif assigned is util.Uninferable:
-                return
+                stack.pop()
             else:
                 # we are not yet on the last part of the path search on each
                 # possibly inferred value
                 try:
-                    for inferred in _resolve_asspart(assigned.infer(context),
-                                                     asspath, context):
-                        yield inferred
+                    stack.append(iter(assigned.infer(context)))
                 except exceptions.InferenceError:
-                    return
+                    stack.pop()
+        except StopIteration:
+            stack.pop()
+        except exceptions.InferenceError:
+            if not depth:
+                raise
+            # An inference failure on a nested level stops the
+            # resolution of the enclosing level as well.
+            del stack[-2:]
 
 
 @decorators.raise_if_nothing_inferred
@@ -376,6 +376,7 @@ def _astroid_bootstrapping(astroid_builtin=None):
         astroid_builtin = Astroid_BUILDER.inspect_build(builtins)
 
     # pylint: disable=redefined-outer-name
+    container_classes = (dict, list, set, tuple)
     for cls, node_cls in node_classes.CONST_CLS.items():
         if cls is type(None):
             proxy = build_class('NoneType')
@@ -385,7 +386,7 @@ def _astroid_bootstrapping(astroid_builtin=None):
             proxy.parent = astroid_builtin
         else:
             proxy = astroid_builtin.getattr(cls.__name__)[0]
-        if cls in (dict, list, set, tuple):
+        if cls in container_classes:
             node_cls._proxied = proxy
         else:
             _CONST_PROXY[cls] = proxy
@@ -399,12 +400,13 @@ def _set_proxied(const):
     return _CONST_PROXY[const.value.__class__]
 nodes.Const._proxied = property(_set_proxied)
 
+_builtins = MANAGER.astroid_cache[six.moves.builtins.__name__]
+
 _GeneratorType = nodes.ClassDef(types.GeneratorType.__name__, types.GeneratorType.__doc__)
-_GeneratorType.parent = MANAGER.astroid_cache[six.moves.builtins.__name__]
+_GeneratorType.parent = _builtins
 bases.Generator._proxied = _GeneratorType
 Astroid_BUILDER.object_build(bases.Generator._proxied, types.GeneratorType)
 
-_builtins = MANAGER.astroid_cache[six.moves.builtins.__name__]
 BUILTIN_TYPES = (types.GetSetDescriptorType, types.GeneratorType,
                  types.MemberDescriptorType, type(None), type(NotImplemented),
                  types.FunctionType, types.MethodType,
@@ -412,6 +414,6 @@ BUILTIN_TYPES = (types.GetSetDescriptorType, types.GeneratorType,
 for _type in BUILTIN_TYPES:
     if _type.__name__ not in _builtins:
         cls = nodes.ClassDef(_type.__name__, _type.__doc__)
-        cls.parent = MANAGER.astroid_cache[six.moves.builtins.__name__]
+        cls.parent = _builtins
         Astroid_BUILDER.object_build(cls, _type)
         _builtins[_type.__name__] = cls
@@ -34,6 +34,11 @@ from astroid import util
 
 
 BUILTINS = six.moves.builtins.__name__
+_MODULE_PYTYPE = '%s.module' % BUILTINS
+_INSTANCEMETHOD_PYTYPE = '%s.instancemethod' % BUILTINS
+_FUNCTION_PYTYPE = '%s.function' % BUILTINS
+_TYPE_PYTYPE = '%s.type' % BUILTINS
+_CLASSOBJ_PYTYPE = '%s.classobj' % BUILTINS
 ITER_METHODS = ('__iter__', '__getitem__')
 
 
@@ -466,7 +471,7 @@ class Module(LocalsDictNodeNG):
         :returns: The name of the type.
         :rtype: str
         """
-        return '%s.module' % BUILTINS
+        return _MODULE_PYTYPE
 
     def display_type(self):
         """A human readable type of this node.
@@ -1096,8 +1101,8 @@ class Lambda(mixins.FilterStmtsMixin, LocalsDictNodeNG):
         :rtype: str
         """
         if 'method' in self.type:
-            return '%s.instancemethod' % BUILTINS
-        return '%s.function' % BUILTINS
+            return _INSTANCEMETHOD_PYTYPE
+        return _FUNCTION_PYTYPE
 
     def display_type(self):
         """A human readable type of this node.
@@ -1526,6 +1531,18 @@ class FunctionDef(node_classes.Statement, Lambda):
         return next(self.nodes_of_class(yield_nodes,
                                         skip_klass=(FunctionDef, Lambda)), False)
 
+    @decorators_mod.cachedproperty
+    def _return_nodes(self):
+        """The return statements of this function, not of nested functions.
+
+        They are collected once, instead of walking the whole body
+        each time a call to this function is inferred.
+
+        :type: tuple(Return)
+        """
+        return tuple(self.nodes_of_class(node_classes.Return,
+                                         skip_klass=FunctionDef))
+
     def infer_call_result(self, caller, context=None):
         """Infer what the function returns when called.
 
@@ -1555,8 +1572,7 @@ class FunctionDef(node_classes.Statement, Lambda):
                 c._metaclass = metaclass
                 yield c
                 return
-        returns = self.nodes_of_class(node_classes.Return, skip_klass=FunctionDef)
-        for returnnode in returns:
+        for returnnode in self._return_nodes:
             if returnnode.value is None:
                 yield node_classes.Const(None)
             else:
@@ -1880,8 +1896,8 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
         :rtype: str
         """
         if self.newstyle:
-            return '%s.type' % BUILTINS
-        return '%s.classobj' % BUILTINS
+            return _TYPE_PYTYPE
+        return _CLASSOBJ_PYTYPE
 
     def display_type(self):
         """A human readable type of this node.
@@ -2519,10 +2535,7 @@ class ClassDef(mixins.FilterStmtsMixin, LocalsDictNodeNG,
                 # we can't obtain the values, maybe a .deque?
                 continue
 
-            if isinstance(slots, node_classes.Dict):
-                values = [item[0] for item in slots.items]
-            else:
-                values = slots.itered()
+            values = slots.itered()
             if values is util.Uninferable:
                 continue
             if not values:
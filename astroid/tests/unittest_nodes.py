@@ -442,6 +442,31 @@ class ConstNodeTest(unittest.TestCase):
         self._test(u'a')
 
 
+class DictNodeTest(unittest.TestCase):
+
+    def test_getitem_constant_keys(self):
+        node = builder.extract_node('{1: "a", "b": "c", True: "d"}')
+        self.assertEqual(node.getitem(nodes.Const(1)).value, 'a')
+        self.assertEqual(node.getitem(nodes.Const(True)).value, 'a')
+        self.assertEqual(node.getitem(nodes.Const('b')).value, 'c')
+        with self.assertRaises(exceptions.AstroidIndexError):
+            node.getitem(nodes.Const('missing'))
+
+    def test_getitem_inferred_keys(self):
+        node = builder.extract_node('''
+        key = "b"
+        {"a": 1, key: 2} #@
+        ''')
+        self.assertEqual(node.getitem(nodes.Const('a')).value, 1)
+        self.assertEqual(node.getitem(nodes.Const('b')).value, 2)
+        with self.assertRaises(exceptions.AstroidIndexError):
+            node.getitem(nodes.Const('missing'))
+
+    def test_itered(self):
+        node = builder.extract_node('{1: 2, 3: 4, 5: 6}')
+        self.assertEqual([key.value for key in node.itered()], [1, 3, 5])
+
+
 class NameNodeTest(unittest.TestCase):
     def test_assign_to_True(self):
         """test that True and False assignments don't crash"""
@@ -539,6 +564,16 @@ class ArgumentsNodeTC(unittest.TestCase):
         args = ast['func'].args
         self.assertTrue(args.is_argument('x'))
 
+    def test_find_argname(self):
+        ast = builder.parse('''
+            def func(a, b=None): pass
+        ''')
+        args = ast['func'].args
+        index, node = args.find_argname('b')
+        self.assertEqual(index, 1)
+        self.assertIs(node, args.args[1])
+        self.assertEqual(args.find_argname('missing'), (None, None))
+
 
 class UnboundMethodNodeTest(unittest.TestCase):
 
@@ -149,6 +149,18 @@ class ProtocolTests(unittest.TestCase):
         assigned = list(simple_mul_assnode_2.assigned_stmts())
         self.assertNameNodesEqual(['c'], assigned)
 
+    def test_assigned_stmts_nested_assignments(self):
+        assign_stmt = extract_node("""
+        pair = (b, c)
+        a, (d, (e, f)) = x, (y, pair) #@
+        """)
+        assnames = {node.name: node for node in
+                    assign_stmt.nodes_of_class(AssignName)}
+        self.assertNameNodesEqual(['x'], list(assnames['a'].assigned_stmts()))
+        self.assertNameNodesEqual(['y'], list(assnames['d'].assigned_stmts()))
+        self.assertNameNodesEqual(['b'], list(assnames['e'].assigned_stmts()))
+        self.assertNameNodesEqual(['c'], list(assnames['f'].assigned_stmts()))
+
     @require_version(minver='3.6')
     def test_assigned_stmts_annassignments(self):
         annassign_stmts = extract_node("""